@@ -8,26 +8,36 @@ CLICK_DELAY = 0.01
 
 class AutoClicker:
     def __init__(self):
-        self.clicking = False
+        self._active = threading.Event()
         self.mouse_controller = mouse.Controller()
         self.pressed_keys = set()
+        self._alt_keys = frozenset({keyboard.Key.alt_l, keyboard.Key.alt_r})
+        self._toggle_key = keyboard.KeyCode.from_char("x")
 
     def click_loop(self):
+        # Park on the event while idle (no polling wakeups), then click on
+        # monotonic deadlines so cadence doesn't drift with sleep jitter
         while True:
-            if self.clicking:
+            self._active.wait()
+            next_click = time.perf_counter()
+            while self._active.is_set():
                 self.mouse_controller.click(mouse.Button.left)
-                time.sleep(CLICK_DELAY)
-            else:
-                time.sleep(0.05)
+                next_click += CLICK_DELAY
+                sleep_for = next_click - time.perf_counter()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
 
     def on_press(self, key):
         self.pressed_keys.add(key)
 
-        if keyboard.Key.alt_l in self.pressed_keys or keyboard.Key.alt_r in self.pressed_keys:
-            if key == keyboard.KeyCode.from_char("x"):
-                self.clicking = not self.clicking
-                print("ON" if self.clicking else "OFF")
-                time.sleep(0.2)
+        if key == self._toggle_key and not self.pressed_keys.isdisjoint(self._alt_keys):
+            if self._active.is_set():
+                self._active.clear()
+                print("OFF")
+            else:
+                self._active.set()
+                print("ON")
+            time.sleep(0.2)
 
     def on_release(self, key):
         self.pressed_keys.discard(key)
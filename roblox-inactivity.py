@@ -1,10 +1,14 @@
-import random
 import time
 
+import numpy as np
 import pyautogui
 
 pyautogui.FAILSAFE = True
 
+# Schedule decisions are drawn in bulk from one PCG64 generator instead of
+# one Mersenne Twister call per decision
+SCHEDULE_BATCH = 1024
+
 
 class AntiIdle:
     def __init__(self):
@@ -14,12 +18,37 @@ class AntiIdle:
             self.random_walk,
             self.rotate_camera,
         ]
+        self.rng = np.random.default_rng()
+        self._refill_schedule()
+
+    def _refill_schedule(self):
+        """Precompute a batch of wait/action/double-action decisions"""
+        rng = self.rng
+        self._waits = rng.integers(120, 241, size=SCHEDULE_BATCH)
+        self._action_indices = rng.integers(0, len(self.actions), size=SCHEDULE_BATCH)
+        self._doubles = rng.random(SCHEDULE_BATCH) > 0.7
+        self._double_delays = rng.uniform(0.5, 1.5, size=SCHEDULE_BATCH)
+        self._schedule_pos = 0
+
+    def _next_schedule(self):
+        """Pop the next (wait, action, double, delay) decision from the batch"""
+        if self._schedule_pos == SCHEDULE_BATCH:
+            self._refill_schedule()
+
+        i = self._schedule_pos
+        self._schedule_pos += 1
+        return (
+            int(self._waits[i]),
+            self.actions[self._action_indices[i]],
+            bool(self._doubles[i]),
+            float(self._double_delays[i]),
+        )
 
     def human_mouse_move(self):
         x, y = pyautogui.position()
-        new_x = x + random.randint(-50, 50)
-        new_y = y + random.randint(-50, 50)
-        pyautogui.moveTo(new_x, new_y, duration=random.uniform(0.1, 0.5))
+        new_x = x + int(self.rng.integers(-50, 51))
+        new_y = y + int(self.rng.integers(-50, 51))
+        pyautogui.moveTo(new_x, new_y, duration=self.rng.uniform(0.1, 0.5))
 
     def random_jump(self):
         print("Action: Jumping")
@@ -27,8 +56,8 @@ class AntiIdle:
 
     def random_walk(self):
         keys = ["w", "a", "s", "d"]
-        key = random.choice(keys)
-        duration = random.uniform(0.1, 0.8)
+        key = keys[self.rng.integers(0, len(keys))]
+        duration = self.rng.uniform(0.1, 0.8)
         print(f"Action: Walking ({key}) for {duration:.2f}s")
         pyautogui.keyDown(key)
         time.sleep(duration)
@@ -36,8 +65,8 @@ class AntiIdle:
 
     def rotate_camera(self):
         keys = ["left", "right"]
-        key = random.choice(keys)
-        duration = random.uniform(0.2, 0.6)
+        key = keys[self.rng.integers(0, len(keys))]
+        duration = self.rng.uniform(0.2, 0.6)
         print(f"Action: Rotating Camera ({key})")
         pyautogui.keyDown(key)
         time.sleep(duration)
@@ -51,16 +80,16 @@ class AntiIdle:
 
         try:
             while True:
-                wait_time = random.randint(120, 240)
+                wait_time, action, double, double_delay = self._next_schedule()
+
                 print(f"Sleeping for {wait_time} seconds...")
                 time.sleep(wait_time)
 
-                action = random.choice(self.actions)
                 action()
 
-                if random.random() > 0.7:
+                if double:
                     print("Performing double action...")
-                    time.sleep(random.uniform(0.5, 1.5))
+                    time.sleep(double_delay)
                     self.random_jump()
 
         except KeyboardInterrupt: